@@ -2,7 +2,11 @@ use crate::models::{CreateSurveyRequest, PhotoRecord, SurveyCategory, SurveyDeta
 use argon2::{Argon2, PasswordHash, PasswordVerifier};
 use anyhow::Result;
 use chrono::{DateTime, Utc};
-use sqlx::{postgres::PgPoolOptions, types::Json, Pool, Postgres, QueryBuilder};
+use sqlx::{
+    postgres::{PgExecutor, PgPoolOptions},
+    types::Json,
+    Pool, Postgres, QueryBuilder,
+};
 
 #[derive(Clone)]
 pub struct AppState {
@@ -55,10 +59,6 @@ pub async fn create_survey_record(
     pool: &Pool<Postgres>,
     req: CreateSurveyRequest,
 ) -> Result<String> {
-    let category_str = serde_json::to_string(&req.category)?
-        .trim_matches('"')
-        .to_string();
-
     let rec: (String,) = sqlx::query_as(
         r#"
         INSERT INTO survey_records (
@@ -75,7 +75,7 @@ pub async fn create_survey_record(
     .bind(&req.orientation)
     .bind(req.distance)
     .bind(&req.top_distance)
-    .bind(&category_str)
+    .bind(req.category.as_str())
     .bind(Json(&req.details))
     .bind(&req.remarks)
     .fetch_one(pool)
@@ -98,11 +98,6 @@ struct SurveyRecordRow {
     pub created_at: Option<DateTime<Utc>>,
 }
 
-fn parse_category(value: &str) -> SurveyCategory {
-    serde_json::from_str::<SurveyCategory>(&format!("\"{}\"", value))
-        .unwrap_or(SurveyCategory::Unknown)
-}
-
 impl SurveyRecordRow {
     fn into_record(self) -> SurveyRecord {
         SurveyRecord {
@@ -112,7 +107,7 @@ impl SurveyRecordRow {
             orientation: self.orientation,
             distance: self.distance,
             top_distance: self.top_distance,
-            category: parse_category(&self.category),
+            category: SurveyCategory::from_db_str(&self.category),
             details: self.details,
             remarks: self.remarks,
             created_at: self.created_at,
@@ -224,12 +219,15 @@ pub async fn get_survey(pool: &Pool<Postgres>, id: &str) -> Result<Option<Survey
 // ── Photo blob CRUD ──────────────────────────────────────────────────────────
 
 /// Persist a photo blob and return its generated ID.
-pub async fn create_photo(
-    pool: &Pool<Postgres>,
+///
+/// Accepts any executor so a multi-photo upload can insert every part
+/// inside one transaction.
+pub async fn create_photo<'e, E: PgExecutor<'e>>(
+    executor: E,
     survey_id: &str,
     filename: &str,
     content_type: &str,
-    data: Vec<u8>,
+    data: &[u8],
 ) -> Result<String> {
     let id = uuid::Uuid::new_v4().to_string();
     sqlx::query(
@@ -242,12 +240,29 @@ pub async fn create_photo(
     .bind(survey_id)
     .bind(filename)
     .bind(content_type)
-    .bind(&data)
-    .execute(pool)
+    .bind(data)
+    .execute(executor)
     .await?;
     Ok(id)
 }
 
+/// Persist every photo of one upload in a single transaction and return their IDs.
+///
+/// If any INSERT (or the commit) fails, none of the photos are stored.
+pub async fn create_photos<D: AsRef<[u8]>>(
+    pool: &Pool<Postgres>,
+    survey_id: &str,
+    photos: &[(String, String, D)],
+) -> Result<Vec<String>> {
+    let mut tx = pool.begin().await?;
+    let mut ids = Vec::with_capacity(photos.len());
+    for (filename, content_type, data) in photos {
+        ids.push(create_photo(&mut *tx, survey_id, filename, content_type, data.as_ref()).await?);
+    }
+    tx.commit().await?;
+    Ok(ids)
+}
+
 /// List photo metadata for a survey (no blob data).
 pub async fn list_photos(pool: &Pool<Postgres>, survey_id: &str) -> Result<Vec<PhotoRecord>> {
     let rows = sqlx::query_as::<_, PhotoRecord>(
@@ -2,7 +2,7 @@ use crate::auth;
 use crate::database::{self, AppState, SurveyQueryFilters};
 use crate::models::{ApiResponse, CreateSurveyRequest};
 use axum::{
-    body::Body,
+    body::{Body, Bytes},
     extract::{Multipart, Path, Query, State},
     http::{header, HeaderMap, StatusCode},
     response::{IntoResponse, Response},
@@ -147,7 +147,9 @@ pub async fn upload_photo_handler(
         }
     }
 
-    let mut uploaded_ids: Vec<String> = Vec::new();
+    // Read every part before touching the pool, so a slow client never holds
+    // a connection (or an open transaction) while its upload is still streaming.
+    let mut parts: Vec<(String, String, Bytes)> = Vec::new();
 
     loop {
         let field = match multipart.next_field().await {
@@ -159,8 +161,11 @@ pub async fn upload_photo_handler(
             }
         };
 
+        // Some clients send the full client-side path; keep only the last segment.
         let filename = field
             .file_name()
+            .and_then(|s| s.rsplit(['/', '\\']).next())
+            .filter(|s| !s.is_empty())
             .map(|s| s.to_string())
             .unwrap_or_else(|| "photo".to_string());
         let content_type = field
@@ -168,28 +173,19 @@ pub async fn upload_photo_handler(
             .map(|s| s.to_string())
             .unwrap_or_else(|| "application/octet-stream".to_string());
 
+        // Keep the buffered bytes as-is; the insert borrows them without copying.
         let data = match field.bytes().await {
-            Ok(bytes) => bytes.to_vec(),
+            Ok(bytes) => bytes,
             Err(e) => {
                 tracing::error!("Failed to read field bytes: {:?}", e);
                 return (StatusCode::BAD_REQUEST, "Failed to read upload data").into_response();
             }
         };
 
-        match database::create_photo(&state.db, &survey_id, &filename, &content_type, data).await {
-            Ok(id) => uploaded_ids.push(id),
-            Err(e) => {
-                tracing::error!("Failed to save photo: {:?}", e);
-                return (
-                    StatusCode::INTERNAL_SERVER_ERROR,
-                    "Failed to save photo",
-                )
-                    .into_response();
-            }
-        }
+        parts.push((filename, content_type, data));
     }
 
-    if uploaded_ids.is_empty() {
+    if parts.is_empty() {
         return (
             StatusCode::BAD_REQUEST,
             Json(ApiResponse {
@@ -201,6 +197,20 @@ pub async fn upload_photo_handler(
             .into_response();
     }
 
+    // Every part has been read, so only a failed INSERT or commit can fail
+    // from here; create_photos then rolls back any parts already inserted.
+    let uploaded_ids = match database::create_photos(&state.db, &survey_id, &parts).await {
+        Ok(ids) => ids,
+        Err(e) => {
+            tracing::error!("Failed to save photos: {:?}", e);
+            return (
+                StatusCode::INTERNAL_SERVER_ERROR,
+                "Failed to save photo",
+            )
+                .into_response();
+        }
+    };
+
     (
         StatusCode::CREATED,
         Json(serde_json::json!({
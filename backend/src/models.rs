@@ -18,7 +18,7 @@ pub struct SurveyRecord {
     pub created_at: Option<chrono::DateTime<chrono::Utc>>,
 }
 
-#[derive(Debug, Serialize, Deserialize, sqlx::Type, Clone)]
+#[derive(Debug, Serialize, Deserialize, sqlx::Type, Clone, PartialEq, Eq)]
 #[serde(rename_all = "snake_case")]
 #[sqlx(type_name = "varchar")]
 #[sqlx(rename_all = "snake_case")]
@@ -35,6 +35,36 @@ pub enum SurveyCategory {
     Unknown,
 }
 
+impl SurveyCategory {
+    /// The stored/serialized name, matching serde's `snake_case` rename.
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            SurveyCategory::ConnectingPipe => "connecting_pipe",
+            SurveyCategory::CrossingPipe => "crossing_pipe",
+            SurveyCategory::BoxDamage => "box_damage",
+            SurveyCategory::AttachmentLoss => "attachment_loss",
+            SurveyCategory::Siltation => "siltation",
+            SurveyCategory::SectionChange => "section_change",
+            SurveyCategory::CannotPass => "cannot_pass",
+            SurveyCategory::Unknown => "unknown",
+        }
+    }
+
+    /// Inverse of [`SurveyCategory::as_str`]; unrecognized values map to `Unknown`.
+    pub fn from_db_str(value: &str) -> SurveyCategory {
+        match value {
+            "connecting_pipe" => SurveyCategory::ConnectingPipe,
+            "crossing_pipe" => SurveyCategory::CrossingPipe,
+            "box_damage" => SurveyCategory::BoxDamage,
+            "attachment_loss" => SurveyCategory::AttachmentLoss,
+            "siltation" => SurveyCategory::Siltation,
+            "section_change" => SurveyCategory::SectionChange,
+            "cannot_pass" => SurveyCategory::CannotPass,
+            _ => SurveyCategory::Unknown,
+        }
+    }
+}
+
 // Manual implementation for VARCHAR compatibility if needed,
 // using sqlx::Type's built-in support for enums mapped to strings usually works
 // if the DB type is created or if mapped to text.
@@ -116,3 +146,41 @@ pub struct CreateSurveyRequest {
     pub details: SurveyDetails,
     pub remarks: Option<String>,
 }
+
+#[cfg(test)]
+mod tests {
+    use super::SurveyCategory;
+
+    const ALL_CATEGORIES: [SurveyCategory; 8] = [
+        SurveyCategory::ConnectingPipe,
+        SurveyCategory::CrossingPipe,
+        SurveyCategory::BoxDamage,
+        SurveyCategory::AttachmentLoss,
+        SurveyCategory::Siltation,
+        SurveyCategory::SectionChange,
+        SurveyCategory::CannotPass,
+        SurveyCategory::Unknown,
+    ];
+
+    #[test]
+    fn as_str_matches_serde() {
+        for category in ALL_CATEGORIES {
+            let serialized = serde_json::to_string(&category).unwrap();
+            assert_eq!(category.as_str(), serialized.trim_matches('"'));
+
+            let parsed: SurveyCategory = serde_json::from_str(&serialized).unwrap();
+            assert_eq!(parsed, category);
+        }
+    }
+
+    #[test]
+    fn from_db_str_round_trips_as_str() {
+        for category in ALL_CATEGORIES {
+            assert_eq!(SurveyCategory::from_db_str(category.as_str()), category);
+        }
+        assert_eq!(
+            SurveyCategory::from_db_str("not_a_category"),
+            SurveyCategory::Unknown
+        );
+    }
+}
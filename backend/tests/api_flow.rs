@@ -9,6 +9,7 @@
 use axum::{
     body::Body,
     http::{Request, StatusCode},
+    Router,
 };
 use anyhow::Context;
 use argon2::password_hash::{rand_core::OsRng, SaltString};
@@ -26,6 +27,72 @@ fn set_default_env(key: &str, value: &str) {
     }
 }
 
+/// Build a multipart/form-data body with one `file` part per `(filename, bytes)`.
+fn multipart_body(boundary: &str, parts: &[(&str, &[u8])]) -> Vec<u8> {
+    let mut body: Vec<u8> = Vec::new();
+    for (filename, data) in parts {
+        body.extend_from_slice(
+            format!(
+                "--{boundary}\r\n\
+                 Content-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n\
+                 Content-Type: image/jpeg\r\n\
+                 \r\n",
+                boundary = boundary,
+                filename = filename,
+            )
+            .as_bytes(),
+        );
+        body.extend_from_slice(data);
+        body.extend_from_slice(b"\r\n");
+    }
+    body.extend_from_slice(format!("--{boundary}--\r\n", boundary = boundary).as_bytes());
+    body
+}
+
+fn upload_request(survey_id: &str, token: &str, boundary: &str, body: Vec<u8>) -> Request<Body> {
+    Request::builder()
+        .method("POST")
+        .uri(format!("/api/surveys/{}/photos", survey_id))
+        .header("authorization", format!("Bearer {}", token))
+        .header(
+            "content-type",
+            format!("multipart/form-data; boundary={}", boundary),
+        )
+        .body(Body::from(body))
+        .unwrap()
+}
+
+async fn list_photo_ids(app: &Router, survey_id: &str) -> anyhow::Result<Vec<String>> {
+    let list_response = app
+        .clone()
+        .oneshot(
+            Request::builder()
+                .uri(format!("/api/surveys/{}/photos", survey_id))
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await?;
+
+    anyhow::ensure!(
+        list_response.status() == StatusCode::OK,
+        "list photos failed"
+    );
+
+    let list_body = list_response.into_body().collect().await?.to_bytes();
+    let list_json: serde_json::Value = serde_json::from_slice(&list_body)?;
+    list_json
+        .as_array()
+        .ok_or_else(|| anyhow::anyhow!("expected array from list photos"))?
+        .iter()
+        .map(|p| {
+            p["id"]
+                .as_str()
+                .map(|s| s.to_string())
+                .ok_or_else(|| anyhow::anyhow!("photo without id"))
+        })
+        .collect()
+}
+
 async fn setup() -> database::AppState {
     set_default_env(
         "DATABASE_URL",
@@ -143,36 +210,18 @@ async fn test_api_flow_happy_path() {
         );
         created_survey_id = Some(survey_id.clone());
 
-        // ── Upload photo as blob ───────────────────────────────────────────────
+        // ── Upload photos as blobs (two parts, one request) ──────────────────
         let boundary = "----AFlowBoundary42";
-        let photo_bytes = b"fake_photo_content";
-        let mut body_bytes: Vec<u8> = format!(
-            "--{boundary}\r\n\
-             Content-Disposition: form-data; name=\"file\"; filename=\"photo.jpg\"\r\n\
-             Content-Type: image/jpeg\r\n\
-             \r\n",
-            boundary = boundary,
-        )
-        .into_bytes();
-        body_bytes.extend_from_slice(photo_bytes);
-        body_bytes.extend_from_slice(
-            format!("\r\n--{boundary}--\r\n", boundary = boundary).as_bytes(),
+        let photo_bytes: &[u8] = b"fake_photo_content";
+        let second_bytes: &[u8] = b"second_photo_content";
+        let body_bytes = multipart_body(
+            boundary,
+            &[("photo.jpg", photo_bytes), ("photo2.jpg", second_bytes)],
         );
 
         let upload_response = app
             .clone()
-            .oneshot(
-                Request::builder()
-                    .method("POST")
-                    .uri(format!("/api/surveys/{}/photos", survey_id))
-                    .header("authorization", format!("Bearer {}", token))
-                    .header(
-                        "content-type",
-                        format!("multipart/form-data; boundary={}", boundary),
-                    )
-                    .body(Body::from(body_bytes))
-                    .unwrap(),
-            )
+            .oneshot(upload_request(&survey_id, &token, boundary, body_bytes))
             .await
             .context("photo upload request")?;
 
@@ -184,36 +233,27 @@ async fn test_api_flow_happy_path() {
 
         let upload_body = upload_response.into_body().collect().await?.to_bytes();
         let upload_json: serde_json::Value = serde_json::from_slice(&upload_body)?;
-        let photo_id = upload_json["photo_ids"]
+        let photo_ids: Vec<String> = upload_json["photo_ids"]
             .as_array()
-            .and_then(|arr| arr.first())
-            .and_then(|v| v.as_str())
-            .ok_or_else(|| anyhow::anyhow!("missing photo_id in upload response"))?
-            .to_string();
+            .ok_or_else(|| anyhow::anyhow!("missing photo_ids in upload response"))?
+            .iter()
+            .filter_map(|v| v.as_str().map(|s| s.to_string()))
+            .collect();
+        anyhow::ensure!(
+            photo_ids.len() == 2,
+            "expected 2 photo_ids, got {:?}",
+            photo_ids
+        );
+        let photo_id = photo_ids[0].clone();
 
         // ── List photos ───────────────────────────────────────────────────────
-        let list_response = app
-            .clone()
-            .oneshot(
-                Request::builder()
-                    .uri(format!("/api/surveys/{}/photos", survey_id))
-                    .body(Body::empty())
-                    .unwrap(),
-            )
-            .await?;
-
+        let listed = list_photo_ids(&app, &survey_id).await?;
+        anyhow::ensure!(listed.len() == 2, "expected 2 photos in list");
         anyhow::ensure!(
-            list_response.status() == StatusCode::OK,
-            "list photos failed"
+            photo_ids.iter().all(|id| listed.contains(id)),
+            "list does not contain every uploaded photo"
         );
 
-        let list_body = list_response.into_body().collect().await?.to_bytes();
-        let list_json: serde_json::Value = serde_json::from_slice(&list_body)?;
-        let photos = list_json
-            .as_array()
-            .ok_or_else(|| anyhow::anyhow!("expected array from list photos"))?;
-        anyhow::ensure!(photos.len() == 1, "expected 1 photo in list");
-
         // ── Download photo ────────────────────────────────────────────────────
         let get_response = app
             .clone()
@@ -238,6 +278,7 @@ async fn test_api_flow_happy_path() {
 
         // ── Delete photo ──────────────────────────────────────────────────────
         let delete_response = app
+            .clone()
             .oneshot(
                 Request::builder()
                     .method("DELETE")
@@ -253,6 +294,123 @@ async fn test_api_flow_happy_path() {
             "delete photo failed"
         );
 
+        // ── Malformed body is rejected before anything is stored ─────────────
+        // A good part followed by one whose body never terminates: the handler
+        // reads every part before inserting, so this fails with 400 up front.
+        let mut broken_body = multipart_body(boundary, &[("good.jpg", photo_bytes)]);
+        broken_body.truncate(broken_body.len() - format!("--{}--\r\n", boundary).len());
+        broken_body.extend_from_slice(
+            format!(
+                "--{boundary}\r\n\
+                 Content-Disposition: form-data; name=\"file\"; filename=\"bad.jpg\"\r\n\
+                 Content-Type: image/jpeg\r\n\
+                 \r\n\
+                 truncated",
+                boundary = boundary,
+            )
+            .as_bytes(),
+        );
+
+        let broken_response = app
+            .clone()
+            .oneshot(upload_request(&survey_id, &token, boundary, broken_body))
+            .await?;
+        anyhow::ensure!(
+            broken_response.status() == StatusCode::BAD_REQUEST,
+            "broken upload should fail, got {}",
+            broken_response.status()
+        );
+
+        let remaining = list_photo_ids(&app, &survey_id).await?;
+        anyhow::ensure!(
+            remaining == vec![photo_ids[1].clone()],
+            "failed upload left photos behind: {:?}",
+            remaining
+        );
+
+        // ── Failed INSERT rolls back the earlier parts ────────────────────────
+        // Postgres rejects NUL in TEXT columns, so the second INSERT fails after
+        // the first has run. A NUL cannot reach the handler through a multipart
+        // header, so drive the same transactional insert directly.
+        let failing_parts = [
+            (
+                "good.jpg".to_string(),
+                "image/jpeg".to_string(),
+                photo_bytes.to_vec(),
+            ),
+            (
+                "bad\0.jpg".to_string(),
+                "image/jpeg".to_string(),
+                photo_bytes.to_vec(),
+            ),
+        ];
+        let insert_result = database::create_photos(&state.db, &survey_id, &failing_parts).await;
+        anyhow::ensure!(
+            insert_result.is_err(),
+            "insert with a NUL filename should fail"
+        );
+
+        let remaining = list_photo_ids(&app, &survey_id).await?;
+        anyhow::ensure!(
+            remaining == vec![photo_ids[1].clone()],
+            "failed insert left photos behind: {:?}",
+            remaining
+        );
+
+        // ── Filename sanitising ───────────────────────────────────────────────
+        let filename_cases = [
+            ("C:\\Users\\x\\photo.jpg", "photo.jpg"),
+            ("dir/sub/", "photo"),
+            ("plain.jpg", "plain.jpg"),
+        ];
+        for (sent, expected) in filename_cases {
+            let upload_response = app
+                .clone()
+                .oneshot(upload_request(
+                    &survey_id,
+                    &token,
+                    boundary,
+                    multipart_body(boundary, &[(sent, photo_bytes)]),
+                ))
+                .await?;
+            anyhow::ensure!(
+                upload_response.status() == StatusCode::CREATED,
+                "upload with filename {:?} failed: {}",
+                sent,
+                upload_response.status()
+            );
+
+            let upload_body = upload_response.into_body().collect().await?.to_bytes();
+            let upload_json: serde_json::Value = serde_json::from_slice(&upload_body)?;
+            let photo_id = upload_json["photo_ids"][0]
+                .as_str()
+                .ok_or_else(|| anyhow::anyhow!("missing photo_id for {:?}", sent))?
+                .to_string();
+
+            let get_response = app
+                .clone()
+                .oneshot(
+                    Request::builder()
+                        .uri(format!("/api/photos/{}", photo_id))
+                        .body(Body::empty())
+                        .unwrap(),
+                )
+                .await?;
+            let disposition = get_response
+                .headers()
+                .get("content-disposition")
+                .and_then(|v| v.to_str().ok())
+                .unwrap_or_default()
+                .to_string();
+            anyhow::ensure!(
+                disposition == format!("inline; filename=\"{}\"", expected),
+                "filename {:?} stored as {:?}, expected {:?}",
+                sent,
+                disposition,
+                expected
+            );
+        }
+
         Ok(())
     }
     .await;